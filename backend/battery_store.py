@@ -0,0 +1,177 @@
+"""
+EV Life Manager - Battery Log Store
+Columnar (struct-of-arrays) in-memory storage for battery telemetry
+
+Kept free of FastAPI imports and fully annotated so it can be compiled
+with mypyc (``mypyc battery_store.py``); the resulting extension module
+shadows this file on import.
+"""
+
+import os
+import time
+from collections import defaultdict
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+
+INITIAL_CAPACITY = 1024
+
+# Column name -> dtype
+COLUMNS = {
+    "id": object,
+    "vehicle_id": object,
+    "soc": np.int16,
+    "soh": np.int16,
+    "voltage": np.float64,
+    "temperature": np.int16,
+    "health_score": np.int16,
+    "recorded_at": "datetime64[us]",
+    "created_at": "datetime64[us]",
+}
+
+OPTIONAL_COLUMNS = ("voltage", "temperature", "health_score")
+
+# Fixed-point columns: stored value = round(reading * scale).
+# Percentages keep 0.01 resolution (0..10000), temperature 0.1 degC.
+SCALES = {"soc": 100, "soh": 100, "health_score": 100, "temperature": 10}
+
+# Missing optional readings: NaN in float columns, this sentinel in int16 ones
+MISSING = int(np.iinfo(np.int16).min)
+
+# Last uuid7 issued, as 48-bit ms timestamp << 74 | 74 random bits
+_last_uuid7 = 0
+
+
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562 version 7) for log ids
+
+    An id that would not sort after the previous one (same millisecond, or
+    the clock stepped back) becomes the previous id plus one in its random
+    bits (RFC 9562 method 2), so ids from this process strictly increase.
+    """
+    global _last_uuid7
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 74
+    value |= int.from_bytes(os.urandom(10), "big") >> 6
+    value = max(value, _last_uuid7 + 1)
+    _last_uuid7 = value
+
+    rand_a = (value >> 62) & 0xFFF
+    rand_b = value & (2**62 - 1)
+    return UUID(
+        int=(value >> 74) << 80
+        | 0x7 << 76  # version 7
+        | rand_a << 64
+        | 0x2 << 62  # RFC 4122 variant
+        | rand_b
+    )
+
+
+class BatteryLogStore:
+    """Battery logs kept as parallel NumPy columns with a write cursor"""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self.size = 0
+        self.columns: dict[str, np.ndarray[Any, Any]] = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        # vehicle_id -> its row indices, in insertion (= recorded_at) order
+        self.rows_by_vehicle: defaultdict[Any, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, log: dict[str, Any]) -> int:
+        """Append one log row and return its row index
+
+        Writes scalars straight into the columns; building per-column arrays
+        as ``extend`` does only pays off for real batches.
+        """
+        index = self.size
+        self._reserve(index + 1)
+
+        for name, column in self.columns.items():
+            value = log[name]
+            if name in SCALES:
+                column[index] = (
+                    MISSING if value is None else round(value * SCALES[name])
+                )
+            elif name in OPTIONAL_COLUMNS and value is None:
+                column[index] = np.nan
+            else:
+                column[index] = value
+
+        self.rows_by_vehicle[log["vehicle_id"]].append(index)
+        self.size = index + 1
+        return index
+
+    def extend(self, logs: list[dict[str, Any]]) -> range:
+        """Append log rows column by column and return their row indices"""
+        start = self.size
+        stop = start + len(logs)
+        self._reserve(stop)
+
+        for name, column in self.columns.items():
+            values = [log[name] for log in logs]
+            if name in SCALES:
+                column[start:stop] = _quantize(_floats(values), SCALES[name])
+            elif name in OPTIONAL_COLUMNS:
+                column[start:stop] = _floats(values)
+            else:
+                column[start:stop] = values
+
+        for index, log in enumerate(logs, start):
+            self.rows_by_vehicle[log["vehicle_id"]].append(index)
+
+        self.size = stop
+        return range(start, stop)
+
+    def latest_row(self, vehicle_id: Any) -> Optional[int]:
+        """Row index of the vehicle's most recent log, or None"""
+        rows = self.rows_by_vehicle.get(vehicle_id)
+        return rows[-1] if rows else None
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Materialize one row as a plain dict"""
+        return {
+            name: _to_python(name, column[index])
+            for name, column in self.columns.items()
+        }
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow to hold ``capacity`` rows, doubling so appends stay amortized O(1)"""
+        current = len(self.columns["id"])
+        if capacity <= current:
+            return
+
+        new_capacity = max(current, 1)
+        while new_capacity < capacity:
+            new_capacity *= 2
+
+        for name, column in self.columns.items():
+            grown = np.empty(new_capacity, dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            self.columns[name] = grown
+
+
+def _floats(values: list[Any]) -> np.ndarray[Any, Any]:
+    return np.array(
+        [np.nan if value is None else value for value in values], dtype=np.float64
+    )
+
+
+def _quantize(readings: np.ndarray[Any, Any], scale: int) -> np.ndarray[Any, Any]:
+    scaled = np.rint(np.nan_to_num(readings * scale, nan=MISSING))
+    quantized: np.ndarray[Any, Any] = scaled.astype(np.int16)
+    return quantized
+
+
+def _to_python(name: str, value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if name in SCALES:
+        return None if value == MISSING else value / SCALES[name]
+    if name in OPTIONAL_COLUMNS and value != value:  # NaN
+        return None
+    return value
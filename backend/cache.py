@@ -0,0 +1,107 @@
+"""
+EV Life Manager - Response Cache
+Redis-backed cache for the JSON bodies of read endpoints
+
+Bodies live in one Redis hash per resource (e.g. ``ev:vehicle:{id}:sessions``
+with a field per page), so a write drops everything cached for that resource
+with a single UNLINK instead of scanning the keyspace. Each resource also has
+a generation counter that writes bump; a read only keeps the body it filled
+if the generation did not change while the body was being rendered.
+"""
+
+from functools import wraps
+from typing import Optional
+
+import orjson
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+CACHE_PREFIX = "ev:"
+GENERATION_SUFFIX = ":gen"
+
+_redis: Optional[Redis] = None
+_ttl_seconds = 30
+
+
+def init_cache(redis_url: str, ttl_seconds: int = 30) -> None:
+    """Enable caching; until this is called every handler runs uncached"""
+    global _redis, _ttl_seconds
+    _redis = Redis.from_url(redis_url)
+    _ttl_seconds = ttl_seconds
+
+
+def cached(key: str, field: str = ""):
+    """Cache a GET handler's body in hash ``key`` under ``field``
+
+    Both are formatted with the handler's parameters.
+    """
+
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(**kwargs):
+            if _redis is None:
+                return await handler(**kwargs)
+
+            cache_key = CACHE_PREFIX + key.format(**kwargs)
+            cache_field = field.format(**kwargs)
+            try:
+                async with _redis.pipeline(transaction=False) as pipe:
+                    pipe.hget(cache_key, cache_field)
+                    pipe.get(cache_key + GENERATION_SUFFIX)
+                    body, generation = await pipe.execute()
+            except RedisError:
+                return await handler(**kwargs)
+
+            if body is None:
+                body = await _render(await handler(**kwargs))
+                try:
+                    await _store(cache_key, cache_field, body, generation)
+                except RedisError:
+                    pass
+
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+async def _render(result) -> bytes:
+    """Encode a handler result (model, plain data or Response) as JSON bytes"""
+    if isinstance(result, Response):
+        return result.body
+    return orjson.dumps(jsonable_encoder(result))
+
+
+async def _store(
+    cache_key: str, cache_field: str, body: bytes, generation: Optional[bytes]
+) -> None:
+    """Fill a cache entry unless a write invalidated it since ``generation``"""
+    async with _redis.pipeline(transaction=True) as pipe:
+        pipe.hset(cache_key, cache_field, body)
+        pipe.expire(cache_key, _ttl_seconds)
+        pipe.get(cache_key + GENERATION_SUFFIX)
+        *_, current = await pipe.execute()
+
+    if current != generation:
+        # The body may predate that write; drop it rather than serve it
+        await _redis.hdel(cache_key, cache_field)
+
+
+async def invalidate(key: str) -> None:
+    """Drop every cached body stored under hash ``key``"""
+    if _redis is None:
+        return
+
+    cache_key = CACHE_PREFIX + key
+    generation_key = cache_key + GENERATION_SUFFIX
+    try:
+        async with _redis.pipeline(transaction=True) as pipe:
+            pipe.unlink(cache_key)
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, _ttl_seconds)
+            await pipe.execute()
+    except RedisError:
+        pass
@@ -1,11 +1,34 @@
 """Application Configuration"""
 
 import os
+from dataclasses import dataclass, field, fields
 from typing import Optional
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
+# .env 값은 이미 설정된 환경 변수를 덮어쓰지 않음
+load_dotenv()
+
+
+_TRUE_VALUES = ("1", "true", "t", "yes", "y", "on")
+_FALSE_VALUES = ("0", "false", "f", "no", "n", "off")
+
+
+def _parse_env(raw: str, type_: type) -> object:
+    """환경 변수 문자열을 필드 타입으로 변환 (알 수 없는 값은 ValueError)"""
+    if type_ is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        raise ValueError(f"invalid boolean {raw!r}")
+    if type_ is int:
+        return int(raw)
+    return raw
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Settings:
     """Application Settings"""
     
     # Application
@@ -18,13 +41,13 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     
-    # Database
-    DATABASE_URL: str
+    # Database (인메모리 API는 사용하지 않음; DB 연결 시 필수)
+    DATABASE_URL: Optional[str] = None
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
     
-    # Security
-    SECRET_KEY: str
+    # Security (JWT 발급 시 필수)
+    SECRET_KEY: Optional[str] = None
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
@@ -50,26 +73,38 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL_SECONDS: int = 30
     
     # Feature Flags
     FEATURE_AI_PREDICTION: bool = True
     FEATURE_CHARGING_OPTIMIZER: bool = True
+    FEATURE_RESPONSE_CACHE: bool = False
+    
+    # CORS_ORIGINS를 파싱한 결과 (생성 시 한 번만 계산)
+    cors_origins_list: tuple[str, ...] = field(init=False, default=())
     
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """CORS origins를 리스트로 변환"""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    def __post_init__(self) -> None:
+        origins = tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
+        object.__setattr__(self, "cors_origins_list", origins)
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """현재 환경 변수 스냅샷으로 설정 생성"""
+        values = {}
+        for setting in fields(cls):
+            raw = os.getenv(setting.name)
+            if setting.init and raw is not None:
+                try:
+                    values[setting.name] = _parse_env(raw, setting.type)
+                except ValueError as e:
+                    raise ValueError(f"{setting.name}: {e}") from None
+        return cls(**values)
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """설정 싱글톤 (캐시됨)"""
-    return Settings()
+# import 시 한 번만 생성
+settings = Settings.from_env()
 
 
-# 사용 예시
-settings = get_settings()
+def get_settings() -> Settings:
+    """설정 싱글톤"""
+    return settings
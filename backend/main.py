@@ -1,52 +1,96 @@
 """
 EV Life Manager - Backend API
 FastAPI-based REST API for EV battery healthcare platform
+
+Handler contract: ``async def`` handlers run on the event loop and must not
+block (no sync DB drivers, ``requests`` calls or file I/O); they may only
+touch in-memory state or ``await`` async clients. A handler that needs a
+blocking call is declared with plain ``def`` so Starlette runs it in the
+threadpool instead of stalling every other request.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
-from datetime import datetime
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from typing import Annotated, Optional, List
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from bisect import insort
+from collections import defaultdict
+from itertools import islice
+from operator import attrgetter
 from uuid import uuid4, UUID
 import os
+import re
+import orjson
 from dotenv import load_dotenv
 
+from battery_store import BatteryLogStore, uuid7
+from cache import cached, init_cache, invalidate
+from config import settings
+
 # Load environment variables
 load_dotenv()
 
 # Create FastAPI app
+# Interactive docs and the OpenAPI schema are not served in production
+IS_PRODUCTION = settings.APP_ENV == "production"
+
 app = FastAPI(
     title="EV Life Manager API",
     description="AI-powered EV Battery Healthcare Platform",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url=None if IS_PRODUCTION else "/docs",
+    redoc_url=None if IS_PRODUCTION else "/redoc",
+    openapi_url=None if IS_PRODUCTION else "/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
-origins = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
-
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (list endpoints repeat field names per row).
+# Added after CORS so it is the outer layer; level 5 is ~2x faster than the
+# default 9 for a few percent less compression.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Redis response cache for read endpoints (opt-in)
+if settings.FEATURE_RESPONSE_CACHE:
+    init_cache(settings.REDIS_URL, ttl_seconds=settings.CACHE_TTL_SECONDS)
+
 
 # ============================================================
 # Pydantic Models (Request/Response Schemas)
 # ============================================================
 
 
+# Single compiled check instead of email-validator's full address parser
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[A-Za-z]{2,}")
+
+
 class UserCreate(BaseModel):
-    email: EmailStr
+    email: str = Field(..., max_length=255)
     password: str = Field(..., min_length=8)
     name: str = Field(..., min_length=1, max_length=100)
     phone: Optional[str] = None
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: str) -> str:
+        """Check the address shape and normalize case for duplicate checks"""
+        if not EMAIL_PATTERN.fullmatch(value):
+            raise ValueError("value is not a valid email address")
+        return value.lower()
+
 
 class UserResponse(BaseModel):
     id: UUID
@@ -81,7 +125,7 @@ class BatteryLogCreate(BaseModel):
     soc: float = Field(..., ge=0, le=100)  # State of Charge
     soh: float = Field(..., ge=0, le=100)  # State of Health
     voltage: Optional[float] = Field(None, gt=0)
-    temperature: Optional[float] = None
+    temperature: Optional[float] = Field(None, ge=-100, le=200)  # degC
     health_score: Optional[float] = Field(None, ge=0, le=100)
 
 
@@ -104,6 +148,14 @@ class ChargingSessionCreate(BaseModel):
     energy_consumed: Optional[float] = Field(None, ge=0)
     cost: Optional[float] = Field(None, ge=0)
 
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Store offset-aware times as naive UTC so sessions stay comparable"""
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
 
 class ChargingSessionResponse(BaseModel):
     id: UUID
@@ -115,38 +167,133 @@ class ChargingSessionResponse(BaseModel):
     created_at: datetime
 
 
+# ============================================================
+# Storage Records (slotted rows for the in-memory tables)
+# ============================================================
+
+
+@dataclass(slots=True, frozen=True)
+class UserRow:
+    id: UUID
+    email: str
+    name: str
+    phone: Optional[str]
+    created_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class VehicleRow:
+    id: UUID
+    user_id: UUID
+    make: str
+    model: str
+    year: int
+    vin: str
+    battery_capacity: float
+    created_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class ChargingSessionRow:
+    id: UUID
+    vehicle_id: UUID
+    start_time: datetime
+    end_time: Optional[datetime]
+    energy_consumed: Optional[float]
+    cost: Optional[float]
+    created_at: datetime
+
+
+# Serializer for list responses, built once at import
+USER_LIST_ADAPTER = TypeAdapter(List[UserRow])
+
+# Validators for the telemetry request bodies, built once at import so
+# pydantic-core parses and validates the raw JSON in a single pass
+BATTERY_LOG_ADAPTER = TypeAdapter(BatteryLogCreate)
+
+# Upper bound on logs per batch request, so one request cannot grow the
+# store's columns arbitrarily
+MAX_BATCH_SIZE = 256
+BATTERY_LOG_BATCH_ADAPTER = TypeAdapter(
+    Annotated[List[BatteryLogCreate], Field(max_length=MAX_BATCH_SIZE)]
+)
+
+
+def validate_body(adapter: TypeAdapter, body: bytes):
+    """Validate a raw JSON body, reporting errors like FastAPI's body parsing"""
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        for error in errors:
+            error["loc"] = ("body", *error["loc"])
+            # Unparsable bodies carry the raw bytes; like FastAPI's own parser,
+            # do not echo them (they may not even decode as UTF-8)
+            if error["type"] == "json_invalid":
+                error["input"] = {}
+        raise RequestValidationError(errors, body=body)
+
+
+def json_body_schema(schema: dict) -> dict:
+    """OpenAPI requestBody for handlers that read the raw request body"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
 # ============================================================
 # In-Memory Storage (임시 데이터베이스)
 # ============================================================
 
 # 실제 프로덕션에서는 PostgreSQL을 사용합니다
-users_db = {}
-vehicles_db = {}
-battery_logs_db = {}
-charging_sessions_db = {}
+users_db: dict[UUID, UserRow] = {}
+vehicles_db: dict[UUID, VehicleRow] = {}
+battery_logs_db = BatteryLogStore()
+charging_sessions_db: dict[UUID, ChargingSessionRow] = {}
+
+# Secondary indexes for unique columns (email/VIN -> row id)
+emails_index: dict[str, UUID] = {}
+vins_index: dict[str, UUID] = {}
+
+# Charging sessions per vehicle, kept sorted by start_time (oldest first)
+sessions_by_vehicle: dict[UUID, list[ChargingSessionRow]] = defaultdict(list)
 
 
 # ============================================================
 # API Endpoints
 # ============================================================
 
+# Endpoints return ORJSONResponse with server-owned rows directly: the rows
+# were built from validated request models, so FastAPI's response_model pass
+# is skipped. response_model stays on each route for the OpenAPI schema.
+
+
+# Constant body for the root endpoint, encoded once at import; the docs links
+# are only advertised where the docs are served
+_ROOT_INFO = {
+    "message": "EV Life Manager API",
+    "version": "1.0.0",
+    "status": "running",
+}
+if not IS_PRODUCTION:
+    _ROOT_INFO.update(docs="/docs", redoc="/redoc")
+_ROOT_BODY = orjson.dumps(_ROOT_INFO)
+
 
 @app.get("/")
 async def root():
     """Root endpoint - API health check"""
-    return {
-        "message": "EV Life Manager API",
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs",
-        "redoc": "/redoc",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    body = orjson.dumps({"status": "healthy", "timestamp": datetime.now()})
+    return Response(content=body, media_type="application/json")
 
 
 # ============================================================
@@ -161,28 +308,28 @@ async def create_user(user: UserCreate):
     """Create a new user"""
     user_id = uuid4()
 
-    # Check if email already exists
-    for existing_user in users_db.values():
-        if existing_user["email"] == user.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-
-    user_data = {
-        "id": user_id,
-        "email": user.email,
-        "name": user.name,
-        "phone": user.phone,
-        "created_at": datetime.now(),
-    }
+    # Claim the email in one step; a conflicting claim fails like a UNIQUE insert
+    if emails_index.setdefault(user.email, user_id) != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
 
-    users_db[user_id] = user_data
+    user_row = UserRow(
+        id=user_id,
+        email=user.email,
+        name=user.name,
+        phone=user.phone,
+        created_at=datetime.now(),
+    )
+
+    users_db[user_id] = user_row
 
-    return UserResponse(**user_data)
+    return ORJSONResponse(user_row, status_code=status.HTTP_201_CREATED)
 
 
 @app.get("/api/users/{user_id}", response_model=UserResponse)
+@cached("user:{user_id}")
 async def get_user(user_id: UUID):
     """Get user by ID"""
     if user_id not in users_db:
@@ -190,14 +337,17 @@ async def get_user(user_id: UUID):
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    return UserResponse(**users_db[user_id])
+    return ORJSONResponse(users_db[user_id])
 
 
 @app.get("/api/users", response_model=List[UserResponse])
-async def list_users(skip: int = 0, limit: int = 100):
+async def list_users(skip: int = Query(0, ge=0), limit: int = Query(100, ge=0)):
     """List all users with pagination"""
-    users_list = list(users_db.values())[skip : skip + limit]
-    return [UserResponse(**user) for user in users_list]
+    users_list = list(islice(users_db.values(), skip, skip + limit))
+    return Response(
+        content=USER_LIST_ADAPTER.dump_json(users_list),
+        media_type="application/json",
+    )
 
 
 # ============================================================
@@ -212,30 +362,30 @@ async def create_vehicle(vehicle: VehicleCreate):
     """Register a new vehicle"""
     vehicle_id = uuid4()
 
-    # Check if VIN already exists
-    for existing_vehicle in vehicles_db.values():
-        if existing_vehicle["vin"] == vehicle.vin:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="VIN already registered"
-            )
-
-    vehicle_data = {
-        "id": vehicle_id,
-        "user_id": vehicle.user_id,
-        "make": vehicle.make,
-        "model": vehicle.model,
-        "year": vehicle.year,
-        "vin": vehicle.vin,
-        "battery_capacity": vehicle.battery_capacity,
-        "created_at": datetime.now(),
-    }
+    # Claim the VIN in one step; a conflicting claim fails like a UNIQUE insert
+    if vins_index.setdefault(vehicle.vin, vehicle_id) != vehicle_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="VIN already registered"
+        )
+
+    vehicle_row = VehicleRow(
+        id=vehicle_id,
+        user_id=vehicle.user_id,
+        make=vehicle.make,
+        model=vehicle.model,
+        year=vehicle.year,
+        vin=vehicle.vin,
+        battery_capacity=vehicle.battery_capacity,
+        created_at=datetime.now(),
+    )
 
-    vehicles_db[vehicle_id] = vehicle_data
+    vehicles_db[vehicle_id] = vehicle_row
 
-    return VehicleResponse(**vehicle_data)
+    return ORJSONResponse(vehicle_row, status_code=status.HTTP_201_CREATED)
 
 
 @app.get("/api/vehicles/{vehicle_id}", response_model=VehicleResponse)
+@cached("vehicle:{vehicle_id}")
 async def get_vehicle(vehicle_id: UUID):
     """Get vehicle by ID"""
     if vehicle_id not in vehicles_db:
@@ -243,10 +393,11 @@ async def get_vehicle(vehicle_id: UUID):
             status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
         )
 
-    return VehicleResponse(**vehicles_db[vehicle_id])
+    return ORJSONResponse(vehicles_db[vehicle_id])
 
 
 @app.get("/api/vehicles/{vehicle_id}/battery", response_model=BatteryLogResponse)
+@cached("vehicle:{vehicle_id}:battery")
 async def get_vehicle_battery_status(vehicle_id: UUID):
     """Get latest battery status for a vehicle"""
     if vehicle_id not in vehicles_db:
@@ -254,20 +405,15 @@ async def get_vehicle_battery_status(vehicle_id: UUID):
             status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
         )
 
-    # Find latest battery log for this vehicle
-    vehicle_logs = [
-        log for log in battery_logs_db.values() if log["vehicle_id"] == vehicle_id
-    ]
+    latest_row = battery_logs_db.latest_row(vehicle_id)
 
-    if not vehicle_logs:
+    if latest_row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No battery data found for this vehicle",
         )
 
-    latest_log = max(vehicle_logs, key=lambda x: x["recorded_at"])
-
-    return BatteryLogResponse(**latest_log)
+    return ORJSONResponse(battery_logs_db.row(latest_row))
 
 
 # ============================================================
@@ -279,15 +425,18 @@ async def get_vehicle_battery_status(vehicle_id: UUID):
     "/api/vehicles/{vehicle_id}/battery-log",
     response_model=BatteryLogResponse,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_schema(BATTERY_LOG_ADAPTER.json_schema()),
 )
-async def create_battery_log(vehicle_id: UUID, log: BatteryLogCreate):
+async def create_battery_log(vehicle_id: UUID, request: Request):
     """Add a new battery log entry"""
+    log = validate_body(BATTERY_LOG_ADAPTER, await request.body())
     if vehicle_id not in vehicles_db:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
         )
 
-    log_id = uuid4()
+    log_id = uuid7()
+    now = datetime.now()
 
     log_data = {
         "id": log_id,
@@ -297,13 +446,59 @@ async def create_battery_log(vehicle_id: UUID, log: BatteryLogCreate):
         "voltage": log.voltage,
         "temperature": log.temperature,
         "health_score": log.health_score,
-        "recorded_at": datetime.now(),
-        "created_at": datetime.now(),
+        "recorded_at": now,
+        "created_at": now,
     }
 
-    battery_logs_db[log_id] = log_data
+    row = battery_logs_db.append(log_data)
+    await invalidate(f"vehicle:{vehicle_id}:battery")
+
+    return ORJSONResponse(battery_logs_db.row(row), status_code=status.HTTP_201_CREATED)
 
-    return BatteryLogResponse(**log_data)
+
+@app.post(
+    "/api/vehicles/{vehicle_id}/battery-logs:batch",
+    response_model=List[UUID],
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_schema(
+        {
+            "type": "array",
+            "items": BATTERY_LOG_ADAPTER.json_schema(),
+            "maxItems": MAX_BATCH_SIZE,
+        }
+    ),
+)
+async def create_battery_logs_batch(vehicle_id: UUID, request: Request):
+    """Add many battery log entries in one request"""
+    logs = validate_body(BATTERY_LOG_BATCH_ADAPTER, await request.body())
+    if vehicle_id not in vehicles_db:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
+        )
+
+    if not logs:
+        return []
+
+    now = datetime.now()
+    log_rows = [
+        {
+            "id": uuid7(),
+            "vehicle_id": vehicle_id,
+            "soc": log.soc,
+            "soh": log.soh,
+            "voltage": log.voltage,
+            "temperature": log.temperature,
+            "health_score": log.health_score,
+            "recorded_at": now,
+            "created_at": now,
+        }
+        for log in logs
+    ]
+
+    battery_logs_db.extend(log_rows)
+    await invalidate(f"vehicle:{vehicle_id}:battery")
+
+    return [log_row["id"] for log_row in log_rows]
 
 
 # ============================================================
@@ -315,24 +510,25 @@ async def create_battery_log(vehicle_id: UUID, log: BatteryLogCreate):
     "/api/vehicles/{vehicle_id}/charging-sessions",
     response_model=List[ChargingSessionResponse],
 )
-async def get_charging_sessions(vehicle_id: UUID, skip: int = 0, limit: int = 100):
+@cached("vehicle:{vehicle_id}:sessions", field="{skip}:{limit}")
+async def get_charging_sessions(
+    vehicle_id: UUID, skip: int = Query(0, ge=0), limit: int = Query(100, ge=0)
+):
     """Get charging sessions for a vehicle"""
     if vehicle_id not in vehicles_db:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Vehicle not found"
         )
 
-    sessions = [
-        session
-        for session in charging_sessions_db.values()
-        if session["vehicle_id"] == vehicle_id
-    ]
-
-    sessions = sorted(sessions, key=lambda x: x["start_time"], reverse=True)
+    # Newest first: slice only the page from the per-vehicle list, then reverse it
+    sessions = sessions_by_vehicle.get(vehicle_id, [])
+    stop = max(len(sessions) - skip, 0)
+    start = max(stop - limit, 0)
 
-    return [
-        ChargingSessionResponse(**session) for session in sessions[skip : skip + limit]
-    ]
+    return Response(
+        content=orjson.dumps(sessions[start:stop][::-1]),
+        media_type="application/json",
+    )
 
 
 @app.post(
@@ -349,19 +545,25 @@ async def create_charging_schedule(session: ChargingSessionCreate):
 
     session_id = uuid4()
 
-    session_data = {
-        "id": session_id,
-        "vehicle_id": session.vehicle_id,
-        "start_time": session.start_time,
-        "end_time": session.end_time,
-        "energy_consumed": session.energy_consumed,
-        "cost": session.cost,
-        "created_at": datetime.now(),
-    }
+    session_row = ChargingSessionRow(
+        id=session_id,
+        vehicle_id=session.vehicle_id,
+        start_time=session.start_time,
+        end_time=session.end_time,
+        energy_consumed=session.energy_consumed,
+        cost=session.cost,
+        created_at=datetime.now(),
+    )
 
-    charging_sessions_db[session_id] = session_data
+    insort(
+        sessions_by_vehicle[session.vehicle_id],
+        session_row,
+        key=attrgetter("start_time"),
+    )
+    charging_sessions_db[session_id] = session_row
+    await invalidate(f"vehicle:{session.vehicle_id}:sessions")
 
-    return ChargingSessionResponse(**session_data)
+    return ORJSONResponse(session_row, status_code=status.HTTP_201_CREATED)
 
 
 # ============================================================
@@ -373,6 +575,15 @@ if __name__ == "__main__":
 
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
+    reload = os.getenv("RELOAD", "False").lower() == "true"
+    # One worker by default: each process has its own in-memory store.
+    # WORKERS=auto starts one worker per CPU once storage is shared. (Not
+    # WEB_CONCURRENCY: gunicorn and uvicorn read that one and need an integer.)
+    workers_env = os.getenv("WORKERS", "1")
+    if workers_env == "auto":
+        workers = os.cpu_count() or 1
+    else:
+        workers = int(workers_env)
 
     print(
         f"""
@@ -390,4 +601,14 @@ if __name__ == "__main__":
     """
     )
 
-    uvicorn.run("main:app", host=host, port=port, reload=True)
+    # uvloop/httptools are requested explicitly so a missing uvicorn[standard]
+    # install fails loudly instead of falling back to asyncio/h11
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+    )
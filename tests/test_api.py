@@ -6,6 +6,8 @@ Comprehensive test suite for all API endpoints
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
+import os
+import subprocess
 import sys
 from pathlib import Path
 import uuid
@@ -109,6 +111,27 @@ def test_root():
     assert data["message"] == "EV Life Manager API"
     assert data["version"] == "1.0.0"
     assert data["status"] == "running"
+    assert data["docs"] == "/docs"
+
+
+def test_docs_disabled_in_production():
+    """Test production serves no docs or schema and does not link to them"""
+    script = (
+        "from fastapi.testclient import TestClient\n"
+        "from main import app\n"
+        "client = TestClient(app)\n"
+        "print(client.get('/docs').status_code, client.get('/redoc').status_code,"
+        " client.get('/openapi.json').status_code, sorted(client.get('/').json()))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=backend_path,
+        env={**os.environ, "APP_ENV": "production"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "404 404 404 ['message', 'status', 'version']"
 
 
 def test_health_check():
@@ -175,6 +198,32 @@ def test_create_user_duplicate_email():
     assert "Email already registered" in response2.json()["detail"]
 
 
+def test_create_user_duplicate_email_case_insensitive():
+    """Test emails differing only in case count as duplicates"""
+    email = f"case_{uuid.uuid4().hex[:8]}@test.com"
+
+    response1 = client.post(
+        "/api/users",
+        json={"email": email, "password": "Pass1234!", "name": "User 1"}
+    )
+    assert response1.status_code == 201
+
+    response2 = client.post(
+        "/api/users",
+        json={"email": email.upper(), "password": "Pass1234!", "name": "User 2"}
+    )
+    assert response2.status_code == 400
+
+
+def test_create_user_invalid_email():
+    """Test user creation with a malformed email"""
+    response = client.post(
+        "/api/users",
+        json={"email": "not-an-email", "password": "Pass1234!", "name": "User"}
+    )
+    assert response.status_code == 422
+
+
 def test_get_user(sample_user):
     """Test get user by ID"""
     response = client.get(f"/api/users/{sample_user['id']}")
@@ -208,6 +257,12 @@ def test_list_users_pagination():
     assert len(data) <= 5
 
 
+def test_list_users_negative_pagination():
+    """Test negative skip/limit are rejected"""
+    assert client.get("/api/users?skip=-1").status_code == 422
+    assert client.get("/api/users?limit=-1").status_code == 422
+
+
 # ============================================================
 # Vehicle Endpoint Tests
 # ============================================================
@@ -342,6 +397,80 @@ def test_create_battery_log_invalid_soc(sample_vehicle):
     assert response.status_code == 422
 
 
+def test_create_battery_logs_batch(sample_vehicle):
+    """Test bulk battery log ingestion"""
+    logs = [
+        {"vehicle_id": sample_vehicle["id"], "soc": soc, "soh": 97.0}
+        for soc in (60.0, 70.0, 80.0)
+    ]
+    response = client.post(
+        f"/api/vehicles/{sample_vehicle['id']}/battery-logs:batch", json=logs
+    )
+    assert response.status_code == 201
+    ids = response.json()
+    assert len(ids) == 3
+    assert len(set(ids)) == 3
+
+    status_response = client.get(f"/api/vehicles/{sample_vehicle['id']}/battery")
+    assert status_response.status_code == 200
+    data = status_response.json()
+    assert data["id"] == ids[-1]
+    assert data["soc"] == 80.0
+    assert data["voltage"] is None
+
+
+def test_create_battery_logs_batch_invalid_item(sample_vehicle):
+    """Test bulk ingestion rejects the whole batch on one invalid log"""
+    logs = [
+        {"vehicle_id": sample_vehicle["id"], "soc": 50.0, "soh": 97.0},
+        {"vehicle_id": sample_vehicle["id"], "soc": 150.0, "soh": 97.0},
+    ]
+    response = client.post(
+        f"/api/vehicles/{sample_vehicle['id']}/battery-logs:batch", json=logs
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 1, "soc"]
+
+    status_response = client.get(f"/api/vehicles/{sample_vehicle['id']}/battery")
+    assert status_response.status_code == 404
+
+
+def test_create_battery_logs_batch_too_large(sample_vehicle):
+    """Test bulk ingestion rejects batches over the size limit"""
+    logs = [
+        {"vehicle_id": sample_vehicle["id"], "soc": 50.0, "soh": 97.0}
+    ] * 257
+    response = client.post(
+        f"/api/vehicles/{sample_vehicle['id']}/battery-logs:batch", json=logs
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "too_long"
+
+
+def test_create_battery_log_malformed_json(sample_vehicle):
+    """Test a body that is not valid JSON is rejected as a validation error"""
+    response = client.post(
+        f"/api/vehicles/{sample_vehicle['id']}/battery-log",
+        content=b'{"soc": ',
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_create_battery_log_non_utf8_body(sample_vehicle):
+    """Test a body that is not UTF-8 is rejected without echoing it back"""
+    response = client.post(
+        f"/api/vehicles/{sample_vehicle['id']}/battery-log",
+        content=b'{"soc": "\xff"}',
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["input"] == {}
+
+
 def test_get_vehicle_battery_status(sample_battery_log):
     """Test get latest battery status"""
     vehicle_id = sample_battery_log["vehicle_id"]
@@ -421,6 +550,87 @@ def test_get_charging_sessions_pagination(sample_charging_session):
     assert len(data) <= 10
 
 
+def test_get_charging_sessions_negative_pagination(sample_vehicle):
+    """Test negative skip/limit are rejected instead of returning empty pages"""
+    url = f"/api/vehicles/{sample_vehicle['id']}/charging-sessions"
+    assert client.get(f"{url}?skip=-2&limit=1").status_code == 422
+    assert client.get(f"{url}?limit=-1").status_code == 422
+
+
+def test_get_charging_sessions_order(sample_vehicle):
+    """Test charging sessions are returned newest first across pages"""
+    for start_time in [
+        "2026-02-05T22:00:00",
+        "2026-02-03T22:00:00",
+        "2026-02-04T22:00:00",
+    ]:
+        response = client.post(
+            "/api/charging/schedule",
+            json={"vehicle_id": sample_vehicle["id"], "start_time": start_time}
+        )
+        assert response.status_code == 201
+
+    response = client.get(
+        f"/api/vehicles/{sample_vehicle['id']}/charging-sessions?skip=1&limit=2"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["start_time"] for s in data] == [
+        "2026-02-04T22:00:00",
+        "2026-02-03T22:00:00",
+    ]
+
+
+def test_charging_sessions_mixed_timezones(sample_vehicle):
+    """Test naive and offset-aware start times can be stored side by side"""
+    for start_time in ["2026-02-06T00:00:00", "2026-02-06T09:30:00+09:00"]:
+        response = client.post(
+            "/api/charging/schedule",
+            json={"vehicle_id": sample_vehicle["id"], "start_time": start_time}
+        )
+        assert response.status_code == 201
+
+    response = client.get(f"/api/vehicles/{sample_vehicle['id']}/charging-sessions")
+    assert [s["start_time"] for s in response.json()] == [
+        "2026-02-06T00:30:00",
+        "2026-02-06T00:00:00",
+    ]
+
+
+def test_get_charging_sessions_gzip(sample_vehicle):
+    """Test large session lists are gzip-compressed on request"""
+    for day in range(1, 21):
+        client.post(
+            "/api/charging/schedule",
+            json={
+                "vehicle_id": sample_vehicle["id"],
+                "start_time": f"2026-03-{day:02d}T22:00:00",
+                "energy_consumed": 40.0,
+                "cost": 11000
+            }
+        )
+
+    response = client.get(
+        f"/api/vehicles/{sample_vehicle['id']}/charging-sessions",
+        headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 20
+
+
+def test_get_charging_sessions_small_uncompressed(sample_vehicle):
+    """Test small session lists are sent uncompressed with a length"""
+    response = client.get(
+        f"/api/vehicles/{sample_vehicle['id']}/charging-sessions",
+        headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == "2"
+    assert response.json() == []
+
+
 def test_get_charging_sessions_no_vehicle():
     """Test get charging sessions for non-existent vehicle"""
     fake_id = "00000000-0000-0000-0000-000000000000"
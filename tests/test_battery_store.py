@@ -0,0 +1,125 @@
+"""
+EV Life Manager - Battery Log Store Tests
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+import time
+import uuid
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from battery_store import BatteryLogStore, uuid7
+
+
+def make_log(vehicle_id, soc, voltage=None):
+    now = datetime(2026, 2, 1, 22, 0, 0, 123456)
+    return {
+        "id": uuid.uuid4(),
+        "vehicle_id": vehicle_id,
+        "soc": soc,
+        "soh": 97.5,
+        "voltage": voltage,
+        "temperature": None,
+        "health_score": None,
+        "recorded_at": now,
+        "created_at": now,
+    }
+
+
+def test_append_grows_capacity():
+    """Test appends past the initial capacity keep earlier rows intact"""
+    store = BatteryLogStore(capacity=1)
+    vehicle_id = uuid.uuid4()
+    logs = [make_log(vehicle_id, soc) for soc in (10.0, 20.0, 30.0)]
+
+    indices = [store.append(log) for log in logs]
+
+    assert indices == [0, 1, 2]
+    assert len(store) == 3
+    assert [store.row(i)["soc"] for i in indices] == [10.0, 20.0, 30.0]
+
+
+def test_append_grows_from_zero_capacity():
+    """Test a store created without capacity still grows on first append"""
+    store = BatteryLogStore(capacity=0)
+
+    index = store.append(make_log(uuid.uuid4(), 42.0))
+
+    assert store.row(index)["soc"] == 42.0
+
+
+def test_row_round_trip():
+    """Test a stored row comes back with Python types and None for gaps"""
+    store = BatteryLogStore()
+    log = make_log(uuid.uuid4(), 85.5, voltage=400.0)
+
+    row = store.row(store.append(log))
+
+    assert row == log
+    assert row["voltage"] == 400.0
+    assert row["temperature"] is None
+    assert isinstance(row["recorded_at"], datetime)
+
+
+def test_fixed_point_resolution():
+    """Test quantized columns keep 0.01 % and 0.1 degC resolution"""
+    store = BatteryLogStore()
+    log = make_log(uuid.uuid4(), 85.37)
+    log["temperature"] = -25.5
+
+    row = store.row(store.append(log))
+
+    assert row["soc"] == 85.37
+    assert row["temperature"] == -25.5
+    assert store.columns["soc"].dtype == "int16"
+
+
+def test_append_matches_extend():
+    """Test the scalar append path stores the same values as a batch"""
+    vehicle_id = uuid.uuid4()
+    logs = [make_log(vehicle_id, soc, voltage=400.0) for soc in (0.0, 33.335, 100.0)]
+    logs[1]["temperature"] = -12.25
+    logs[2]["health_score"] = 91.5
+
+    one_by_one, batched = BatteryLogStore(), BatteryLogStore()
+    for log in logs:
+        one_by_one.append(log)
+    batched.extend(logs)
+
+    assert [one_by_one.row(i) for i in range(3)] == [batched.row(i) for i in range(3)]
+
+
+def test_uuid7_is_time_ordered():
+    """Test log ids carry version 7 and sort by creation time"""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+
+
+def test_uuid7_is_monotonic_within_a_millisecond():
+    """Test ids created back to back are strictly increasing"""
+    ids = [uuid7() for _ in range(1000)]
+
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+    assert {value.version for value in ids} == {7}
+
+
+def test_latest_row_per_vehicle():
+    """Test the per-vehicle index returns each vehicle's newest row"""
+    store = BatteryLogStore()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    store.extend([make_log(first, 10.0), make_log(second, 20.0)])
+    store.append(make_log(first, 30.0))
+
+    assert store.rows_by_vehicle[first] == [0, 2]
+    assert store.row(store.latest_row(first))["soc"] == 30.0
+    assert store.row(store.latest_row(second))["soc"] == 20.0
+    assert store.latest_row(uuid.uuid4()) is None
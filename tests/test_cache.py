@@ -0,0 +1,148 @@
+"""
+EV Life Manager - Response Cache Tests
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+import cache
+from cache import cached, invalidate
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on ``execute``"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self):
+        if self.redis.down:
+            raise RedisConnectionError("redis is down")
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """Just enough of ``redis.asyncio.Redis`` for the cache module"""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    async def hdel(self, key, field):
+        self.data.get(key, {}).pop(field, None)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+
+    async def expire(self, key, seconds):
+        pass
+
+    async def unlink(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_redis", fake)
+    return fake
+
+
+def make_handler(calls):
+    @cached("vehicle:{vehicle_id}:sessions", field="{skip}")
+    async def handler(vehicle_id, skip):
+        calls.append(skip)
+        return {"vehicle_id": vehicle_id, "skip": skip, "calls": len(calls)}
+
+    return handler
+
+
+def test_cache_miss_then_hit(redis):
+    """Test a body is rendered once and then served from the hash field"""
+    calls = []
+    handler = make_handler(calls)
+
+    first = asyncio.run(handler(vehicle_id="v1", skip=0))
+    second = asyncio.run(handler(vehicle_id="v1", skip=0))
+
+    assert calls == [0]
+    assert first.body == second.body == b'{"vehicle_id":"v1","skip":0,"calls":1}'
+    assert redis.data["ev:vehicle:v1:sessions"] == {"0": first.body}
+
+
+def test_invalidate_drops_every_field(redis):
+    """Test one invalidate clears all cached pages of the resource"""
+    calls = []
+    handler = make_handler(calls)
+    asyncio.run(handler(vehicle_id="v1", skip=0))
+    asyncio.run(handler(vehicle_id="v1", skip=10))
+    asyncio.run(handler(vehicle_id="v2", skip=0))
+
+    asyncio.run(invalidate("vehicle:v1:sessions"))
+    asyncio.run(handler(vehicle_id="v1", skip=0))
+
+    assert calls == [0, 10, 0, 0]
+    assert "ev:vehicle:v2:sessions" in redis.data
+
+
+def test_write_during_render_is_not_cached(redis):
+    """Test a body rendered before a concurrent write is not kept"""
+
+    @cached("vehicle:{vehicle_id}:battery")
+    async def handler(vehicle_id):
+        body = {"soc": 50.0}
+        # A write lands after the state was read but before the cache fill
+        await invalidate(f"vehicle:{vehicle_id}:battery")
+        return body
+
+    response = asyncio.run(handler(vehicle_id="v1"))
+
+    assert response.body == b'{"soc":50.0}'
+    assert redis.data.get("ev:vehicle:v1:battery", {}) == {}
+
+
+def test_redis_error_falls_back_to_handler(redis):
+    """Test the handler still answers when Redis is unreachable"""
+    calls = []
+    handler = make_handler(calls)
+    redis.down = True
+
+    response = asyncio.run(handler(vehicle_id="v1", skip=0))
+    asyncio.run(invalidate("vehicle:v1:sessions"))
+
+    assert calls == [0]
+    assert response["calls"] == 1
@@ -0,0 +1,55 @@
+"""
+EV Life Manager - Settings Tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from config import Settings
+
+
+def test_defaults_without_credentials(monkeypatch):
+    """Test settings load without database or JWT credentials"""
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+
+    settings = Settings.from_env()
+
+    assert settings.DATABASE_URL is None
+    assert settings.SECRET_KEY is None
+
+
+def test_bool_parsing(monkeypatch):
+    """Test recognized boolean strings in either case"""
+    monkeypatch.setenv("DEBUG", "Off")
+    monkeypatch.setenv("FEATURE_RESPONSE_CACHE", "TRUE")
+
+    settings = Settings.from_env()
+
+    assert settings.DEBUG is False
+    assert settings.FEATURE_RESPONSE_CACHE is True
+
+
+def test_single_letter_bools(monkeypatch):
+    """Test the t/f/y/n forms pydantic-settings accepted still load"""
+    monkeypatch.setenv("DEBUG", "f")
+    monkeypatch.setenv("FEATURE_RESPONSE_CACHE", "y")
+
+    settings = Settings.from_env()
+
+    assert settings.DEBUG is False
+    assert settings.FEATURE_RESPONSE_CACHE is True
+
+
+def test_invalid_bool_is_rejected(monkeypatch):
+    """Test an unrecognized boolean raises instead of reading as False"""
+    monkeypatch.setenv("FEATURE_RESPONSE_CACHE", "ture")
+
+    with pytest.raises(ValueError, match="FEATURE_RESPONSE_CACHE"):
+        Settings.from_env()